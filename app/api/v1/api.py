@@ -8,6 +8,7 @@ from app.api.v1.endpoints import (
     bookings,
     clients,
     custom_items,
+    dashboard,
     inventory_items,
     inventory_types,
 )
@@ -35,3 +36,4 @@ api_router.include_router(
     custom_items.router, prefix="/custom-items", tags=["custom-items"]
 )
 api_router.include_router(batch.router, prefix="/batch", tags=["batch-operations"])
+api_router.include_router(dashboard.router, prefix="/dashboard", tags=["dashboard"])
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from fastapi import APIRouter, Query
 
@@ -9,12 +9,12 @@ from app.schemas.accommodation import (
     AccommodationCreate,
     AccommodationUpdate,
 )
-from app.schemas.responses import MessageResponse
+from app.schemas.responses import CountResponse, MessageResponse
 
 router = APIRouter()
 
 
-@router.get("/", response_model=List[Accommodation])
+@router.get("/", response_model=Union[List[Accommodation], CountResponse])
 async def get_accommodations(
     service: AccommodationServiceDep,
     current_user: CurrentUserDep,
@@ -22,8 +22,15 @@ async def get_accommodations(
     status: Optional[AccommodationStatus] = Query(
         None, description="Filter by accommodation status"
     ),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    count_only: bool = Query(
+        False, description="Return only the matching record count"
+    ),
 ):
-    return await service.get_all(type_id=type_id, status=status)
+    if count_only:
+        return CountResponse(count=await service.count(type_id=type_id, status=status))
+    return await service.get_all(type_id=type_id, status=status, skip=skip, limit=limit)
 
 
 @router.post("/", response_model=Accommodation)
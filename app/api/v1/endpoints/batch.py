@@ -10,6 +10,7 @@ from app.schemas.batch import (
     BookingStatusUpdateOperation,
     BulkBookingConfirmation,
     BulkDateAssignment,
+    ClientUpdateOperation,
 )
 
 router = APIRouter()
@@ -85,6 +86,18 @@ async def bulk_update_accommodation_status(
     )
 
 
+# Client batch operations
+@router.post("/clients/update", response_model=BatchJobResult)
+async def bulk_update_clients(
+    operation: ClientUpdateOperation,
+    service: BatchOperationServiceDep,
+    current_user: StaffUserDep,
+    dry_run: bool = Query(False, description="Preview changes without executing"),
+):
+    """Bulk update client fields with transaction safety."""
+    return await service.bulk_update_clients(operation, current_user.id, dry_run)
+
+
 # Generic batch operation endpoint
 @router.post("/execute", response_model=BatchJobResult)
 async def execute_batch_operation(
@@ -1,11 +1,13 @@
 from datetime import date
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from fastapi import APIRouter, HTTPException, Path, Query
 
 from app.core.common_deps import (
+    AccommodationServiceDep,
     BookingServiceDep,
     CalendarServiceDep,
+    ClientServiceDep,
     CurrentUserDep,
     StaffUserDep,
 )
@@ -24,6 +26,7 @@ from app.schemas.booking import (
     BookingWithDetails,
     BookingWithFullDetails,
     BookingWithItems,
+    CalendarDaySummary,
     CalendarEvent,
     CalendarOccupancy,
 )
@@ -31,8 +34,11 @@ from app.schemas.responses import (
     AccommodationAvailabilityResponse,
     AvailableAccommodation,
     BookingActionResponse,
+    BookingFormBootstrapResponse,
     CalendarStatistics,
+    CountResponse,
     MessageResponse,
+    TodayActivityResponse,
 )
 from app.schemas.search import BookingSearchRequest
 
@@ -40,7 +46,7 @@ router = APIRouter()
 
 
 # Basic CRUD operations
-@router.get("/", response_model=List[Booking])
+@router.get("/", response_model=Union[List[Booking], CountResponse])
 async def get_bookings(
     service: BookingServiceDep,
     current_user: CurrentUserDep,
@@ -49,8 +55,32 @@ async def get_bookings(
     status: Optional[BookingStatus] = Query(
         None, description="Filter by booking status"
     ),
+    status_in: Optional[str] = Query(
+        None,
+        alias="status__in",
+        description="Comma-separated list of booking statuses to filter by",
+    ),
+    count_only: bool = Query(
+        False, description="Return only the matching record count"
+    ),
 ):
     """Get list of bookings with optional status filter"""
+    if status_in:
+        try:
+            statuses = [
+                BookingStatus(value.strip())
+                for value in status_in.split(",")
+                if value.strip()
+            ]
+        except ValueError:
+            raise HTTPException(
+                status_code=400, detail=f"Invalid booking status in: {status_in}"
+            )
+        if count_only:
+            return CountResponse(count=await service.count_by_statuses(statuses))
+        return await service.get_by_statuses(statuses, skip, limit)
+    if count_only:
+        return CountResponse(count=await service.count(status))
     if status:
         return await service.get_by_status(status, skip, limit)
     return await service.get_all(skip, limit)
@@ -66,6 +96,56 @@ async def create_booking(
     return await service.create(booking_data)
 
 
+@router.get("/form-bootstrap", response_model=BookingFormBootstrapResponse)
+async def get_booking_form_bootstrap(
+    client_service: ClientServiceDep,
+    accommodation_service: AccommodationServiceDep,
+    calendar_service: CalendarServiceDep,
+    current_user: CurrentUserDep,
+    start_date: Optional[date] = Query(
+        None, description="Check-in date for the availability lookup (YYYY-MM-DD)"
+    ),
+    end_date: Optional[date] = Query(
+        None, description="Check-out date for the availability lookup (YYYY-MM-DD)"
+    ),
+    capacity: Optional[int] = Query(None, ge=1, description="Minimum capacity needed"),
+):
+    """Get clients, accommodations and availability for the booking form in one call"""
+    if (start_date is None) != (end_date is None):
+        raise HTTPException(
+            status_code=400,
+            detail="start_date and end_date must be provided together",
+        )
+
+    available = []
+    if start_date and end_date:
+        if start_date >= end_date:
+            raise HTTPException(
+                status_code=400, detail="Check-out date must be after check-in date"
+            )
+        accommodations = await calendar_service.get_available_accommodations(
+            start_date, end_date, capacity
+        )
+        available = [
+            AvailableAccommodation(
+                id=acc.id,
+                number=acc.number,
+                type_name=acc.type.name if acc.type else "Unknown",
+                capacity=acc.capacity,
+                price_per_night=acc.price_per_night or 0.0,
+                status=acc.status.value,
+            )
+            for acc in accommodations
+        ]
+
+    # The form needs the complete lists, so bypass the default page size
+    return BookingFormBootstrapResponse(
+        clients=await client_service.get_all(limit=None),
+        accommodations=await accommodation_service.get_all(limit=None),
+        available=available,
+    )
+
+
 @router.get("/{booking_id}", response_model=BookingWithDetails)
 async def get_booking(
     booking_id: int,
@@ -101,6 +181,24 @@ async def delete_booking(
     return MessageResponse(message="Booking deleted successfully")
 
 
+@router.get("/today/counts", response_model=TodayActivityResponse)
+async def get_today_activity_counts(
+    service: BookingServiceDep,
+    current_user: CurrentUserDep,
+    date_: Optional[date] = Query(
+        None, alias="date", description="Date to count for (defaults to today)"
+    ),
+):
+    """Get check-in/check-out counts for a date without listing bookings"""
+    target_date = date_ or date.today()
+    counts = await service.get_daily_activity_counts(target_date)
+    return TodayActivityResponse(
+        date=target_date.isoformat(),
+        checkins=counts["checkins"],
+        checkouts=counts["checkouts"],
+    )
+
+
 # Open dates booking operations
 @router.post("/open-dates", response_model=Booking)
 async def create_open_dates_booking(
@@ -195,6 +293,20 @@ async def get_calendar_occupancy(
     return await calendar_service.get_occupancy_for_date_range(start_date, end_date)
 
 
+@router.get("/calendar/summary", response_model=List[CalendarDaySummary])
+async def get_calendar_summary(
+    calendar_service: CalendarServiceDep,
+    current_user: CurrentUserDep,
+    start_date: date = Query(..., description="Start date (YYYY-MM-DD)"),
+    end_date: date = Query(..., description="End date (YYYY-MM-DD)"),
+):
+    """Get aggregated per-day occupancy counts without accommodation detail"""
+    if start_date >= end_date:
+        raise HTTPException(status_code=400, detail="End date must be after start date")
+
+    return await calendar_service.get_occupancy_summary(start_date, end_date)
+
+
 @router.get("/calendar/events", response_model=List[CalendarEvent])
 async def get_calendar_events(
     calendar_service: CalendarServiceDep,
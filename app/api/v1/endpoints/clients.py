@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from fastapi import APIRouter, HTTPException, Query
 
@@ -17,21 +17,26 @@ from app.schemas.client import (
     ClientUpdate,
     ClientWithStats,
 )
-from app.schemas.responses import MessageResponse
+from app.schemas.responses import CountResponse, MessageResponse
 from app.schemas.search import ClientSearchRequest
 
 router = APIRouter()
 
 
 # Client endpoints
-@router.get("/", response_model=List[Client])
+@router.get("/", response_model=Union[List[Client], CountResponse])
 async def get_clients(
     service: ClientServiceDep,
     current_user: CurrentUserDep,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     search: Optional[str] = Query(None, description="Search by name, phone, or email"),
+    count_only: bool = Query(
+        False, description="Return only the matching record count"
+    ),
 ):
+    if count_only:
+        return CountResponse(count=await service.count(search))
     if search:
         return await service.search_clients(search, skip, limit)
     return await service.get_all(skip, limit)
@@ -78,6 +83,24 @@ async def delete_client(
     return MessageResponse(message="Client deleted successfully")
 
 
+@router.get("/stats/batch", response_model=List[ClientWithStats])
+async def get_client_stats_batch(
+    service: ClientServiceDep,
+    current_user: CurrentUserDep,
+    ids: str = Query(..., description="Comma-separated list of client IDs"),
+):
+    """Get stats for multiple clients in one request"""
+    try:
+        client_ids = [int(value) for value in ids.split(",") if value.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid client IDs: {ids}")
+
+    if not client_ids:
+        raise HTTPException(status_code=400, detail="No client IDs provided")
+
+    return await service.get_client_stats_batch(client_ids)
+
+
 @router.get("/{client_id}/stats", response_model=ClientWithStats)
 async def get_client_stats(
     client_id: int,
@@ -0,0 +1,15 @@
+from fastapi import APIRouter
+
+from app.core.common_deps import CurrentUserDep, DashboardServiceDep
+from app.schemas.responses import DashboardSummaryResponse
+
+router = APIRouter()
+
+
+@router.get("/summary", response_model=DashboardSummaryResponse)
+async def get_dashboard_summary(
+    service: DashboardServiceDep,
+    current_user: CurrentUserDep,
+):
+    """Get aggregated dashboard metrics in a single request"""
+    return await service.get_summary()
@@ -23,6 +23,22 @@ from app.schemas.batch import (
 
 logger = logging.getLogger(__name__)
 
+# Client fields that batch updates are allowed to modify
+CLIENT_UPDATABLE_FIELDS = frozenset(
+    {
+        "first_name",
+        "last_name",
+        "phone",
+        "email",
+        "social_links",
+        "car_numbers",
+        "photo_url",
+        "rating",
+        "comments",
+        "group_id",
+    }
+)
+
 
 class BatchProcessorError(Exception):
     """Base exception for batch processing errors."""
@@ -74,6 +90,9 @@ class SagaBatchProcessor:
         self.operation_handlers[BatchOperationType.ACCOMMODATION_STATUS_UPDATE] = (
             self._handle_accommodation_status_update
         )
+        self.operation_handlers[BatchOperationType.CLIENT_UPDATE] = (
+            self._handle_client_update
+        )
 
         # Compensation handlers
         self.compensation_handlers[BatchOperationType.BOOKING_STATUS_UPDATE] = (
@@ -88,6 +107,9 @@ class SagaBatchProcessor:
         self.compensation_handlers[BatchOperationType.ACCOMMODATION_STATUS_UPDATE] = (
             self._compensate_accommodation_status_update
         )
+        self.compensation_handlers[BatchOperationType.CLIENT_UPDATE] = (
+            self._compensate_client_update
+        )
 
     async def execute_batch(
         self, batch_request: BatchRequest, user_id: Optional[int] = None
@@ -519,6 +541,37 @@ class SagaBatchProcessor:
 
         return {"updated_accommodation_id": target_id, "new_status": new_status.value}
 
+    async def _handle_client_update(self, context: OperationContext) -> Any:
+        """Handle client field update operation."""
+        from app.models.client import Client
+
+        target_id = context.operation.target_id
+        fields = {
+            field: value
+            for field, value in context.operation.parameters.items()
+            if field in CLIENT_UPDATABLE_FIELDS
+        }
+
+        if not fields:
+            raise BatchProcessorError(
+                f"No updatable client fields in parameters: "
+                f"{list(context.operation.parameters.keys())}"
+            )
+
+        if context.dry_run:
+            return {
+                "action": "update_client",
+                "target_id": target_id,
+                "fields": fields,
+            }
+
+        # Update client fields
+        stmt = update(Client).where(Client.id == target_id).values(**fields)
+        await context.db.execute(stmt)
+        await context.db.commit()
+
+        return {"updated_client_id": target_id, "fields": list(fields.keys())}
+
     # Compensation Handlers
     async def _compensate_booking_status_update(
         self, compensation_op: CompensationOperation
@@ -587,6 +640,17 @@ class SagaBatchProcessor:
         await self.db.execute(stmt)
         await self.db.commit()
 
+    async def _compensate_client_update(self, compensation_op: CompensationOperation):
+        """Compensate client update by restoring the original field values."""
+        from app.models.client import Client
+
+        target_id = compensation_op.compensation_data["target_id"]
+        before_state = compensation_op.compensation_data["before_state"]
+
+        stmt = update(Client).where(Client.id == target_id).values(**before_state)
+        await self.db.execute(stmt)
+        await self.db.commit()
+
     # Utility methods
     async def _capture_entity_state(
         self, operation: BatchOperationItem
@@ -630,6 +694,19 @@ class SagaBatchProcessor:
                     "condition": accommodation.condition.value,
                 }
 
+        elif operation.operation_type == BatchOperationType.CLIENT_UPDATE:
+            from app.models.client import Client
+
+            stmt = select(Client).where(Client.id == target_id)
+            result = await self.db.execute(stmt)
+            client = result.scalar_one_or_none()
+            if client:
+                return {
+                    field: getattr(client, field)
+                    for field in CLIENT_UPDATABLE_FIELDS
+                    if field in operation.parameters
+                }
+
         return {}
 
     async def _validate_batch(
@@ -694,6 +771,13 @@ class SagaBatchProcessor:
             result = await self.db.execute(stmt)
             return result.scalar_one_or_none() is not None
 
+        elif operation.operation_type == BatchOperationType.CLIENT_UPDATE:
+            from app.models.client import Client
+
+            stmt = select(Client.id).where(Client.id == target_id)
+            result = await self.db.execute(stmt)
+            return result.scalar_one_or_none() is not None
+
         return False
 
     async def _execute_dry_run(
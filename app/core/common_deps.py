@@ -27,6 +27,7 @@ from app.core.service_deps import (
     GetClientGroupService,
     GetClientService,
     GetCustomItemService,
+    GetDashboardService,
     GetInventoryService,
 )
 from app.models.user import User
@@ -53,3 +54,4 @@ CalendarServiceDep = GetCalendarService
 InventoryServiceDep = GetInventoryService
 CustomItemServiceDep = GetCustomItemService
 BatchOperationServiceDep = GetBatchOperationService
+DashboardServiceDep = GetDashboardService
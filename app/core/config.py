@@ -6,6 +6,7 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "your-secret-key-here-change-this-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    BCRYPT_ROUNDS: int = 12
 
     class Config:
         env_file = ".env"
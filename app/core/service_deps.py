@@ -21,6 +21,7 @@ from app.services.booking_service import BookingService
 from app.services.calendar_service import CalendarService
 from app.services.client_service import ClientGroupService, ClientService
 from app.services.custom_item_service import CustomItemService
+from app.services.dashboard_service import DashboardService
 from app.services.inventory_service import InventoryService
 
 T = TypeVar("T")
@@ -68,6 +69,9 @@ GetCustomItemService = Annotated[
 GetBatchOperationService = Annotated[
     BatchOperationService, Depends(get_service(BatchOperationService))
 ]
+GetDashboardService = Annotated[
+    DashboardService, Depends(get_service(DashboardService))
+]
 
 # Legacy compatibility - individual dependency functions
 get_accommodation_service = get_service(AccommodationService)
@@ -80,3 +84,4 @@ get_calendar_service = get_service(CalendarService)
 get_inventory_service = get_service(InventoryService)
 get_custom_item_service = get_service(CustomItemService)
 get_batch_operation_service = get_service(BatchOperationService)
+get_dashboard_service = get_service(DashboardService)
@@ -1,10 +1,18 @@
-from fastapi import FastAPI
+import time
+from datetime import datetime
+
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.api import api_router
-from app.core.database import async_engine
+from app.core.database import async_engine, get_db
 from app.core.exception_handlers import EXCEPTION_HANDLERS
 from app.models.base import Base
+from app.schemas.responses import HealthCheckResponse
+
+_start_time = time.monotonic()
 
 app = FastAPI(
     title="Booking System API",
@@ -39,6 +47,24 @@ def read_root():
     return {"message": "Booking System API", "version": "1.0.0"}
 
 
+@app.get("/healthz", response_model=HealthCheckResponse)
+async def health_check(db: AsyncSession = Depends(get_db)):
+    """Combined API and database health check in a single request"""
+    try:
+        await db.execute(text("SELECT 1"))
+        database = "connected"
+    except Exception:
+        database = "disconnected"
+
+    return HealthCheckResponse(
+        status="healthy" if database == "connected" else "degraded",
+        timestamp=datetime.utcnow(),
+        version=app.version,
+        database=database,
+        uptime=int(time.monotonic() - _start_time),
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -20,6 +20,7 @@ from .booking import (
     BookingWithDetails,
     BookingWithFullDetails,
     BookingWithItems,
+    CalendarDaySummary,
     CalendarEvent,
     CalendarOccupancy,
 )
@@ -57,11 +58,15 @@ from .responses import (
     AccommodationAvailabilityResponse,
     AvailableAccommodation,
     BookingActionResponse,
+    BookingFormBootstrapResponse,
     CalendarStatistics,
+    CountResponse,
     CurrentUserResponse,
+    DashboardSummaryResponse,
     ErrorResponse,
     HealthCheckResponse,
     MessageResponse,
+    TodayActivityResponse,
     UserRegistrationResponse,
     ValidationErrorResponse,
 )
@@ -103,6 +108,7 @@ __all__ = [
     "BookingWithFullDetails",
     "CalendarOccupancy",
     "CalendarEvent",
+    "CalendarDaySummary",
     # Inventory schemas
     "InventoryType",
     "InventoryTypeCreate",
@@ -130,7 +136,11 @@ __all__ = [
     "AvailableAccommodation",
     "CalendarStatistics",
     "BookingActionResponse",
+    "BookingFormBootstrapResponse",
+    "CountResponse",
+    "DashboardSummaryResponse",
     "ErrorResponse",
+    "TodayActivityResponse",
     "ValidationErrorResponse",
     "HealthCheckResponse",
 ]
@@ -105,6 +105,23 @@ class AccommodationStatusUpdateOperation(BaseModel):
     maintenance_notes: Optional[str] = None
 
 
+class ClientUpdateOperation(BaseModel):
+    """Batch operation for updating client fields."""
+
+    client_updates: List[Dict[str, Any]] = Field(
+        ..., min_items=1, description="List of {client_id, **fields_to_update}"
+    )
+
+    @validator("client_updates")
+    def validate_client_updates(cls, v):
+        for update in v:
+            if "client_id" not in update:
+                raise ValueError("Each update must have a client_id")
+            if len(update) < 2:
+                raise ValueError("Each update must include at least one field")
+        return v
+
+
 class BatchRequest(BaseModel):
     """Main batch operation request."""
 
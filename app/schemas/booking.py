@@ -2,7 +2,7 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 
 from app.models.booking import BookingStatus, PaymentStatus
 
@@ -113,6 +113,12 @@ class Booking(BookingBase):
     actual_check_out: Optional[datetime] = None
     created_at: datetime
 
+    @computed_field
+    @property
+    def balance(self) -> Decimal:
+        """Outstanding amount still owed on the booking."""
+        return self.total_amount - self.paid_amount
+
     class Config:
         from_attributes = True
 
@@ -145,6 +151,15 @@ class CalendarOccupancy(BaseModel):
     accommodations: list[dict]  # List of accommodation occupancy for this date
 
 
+class CalendarDaySummary(BaseModel):
+    """Schema for per-day aggregated occupancy counts"""
+
+    date: date
+    occupied: int
+    total: int
+    occupancy_rate: float
+
+
 class CalendarEvent(BaseModel):
     """Schema for calendar events/bookings"""
 
@@ -11,6 +11,9 @@ from typing import Any, List, Optional
 
 from pydantic import BaseModel, Field
 
+from app.schemas.accommodation import Accommodation
+from app.schemas.client import Client
+
 
 class MessageResponse(BaseModel):
     """Standard response for operations that return a success message."""
@@ -22,6 +25,14 @@ class MessageResponse(BaseModel):
     )
 
 
+class CountResponse(BaseModel):
+    """Response for count-only list requests (``count_only=true``)."""
+
+    count: int = Field(
+        ..., description="Number of records matching the query", example=42
+    )
+
+
 class UserRegistrationResponse(BaseModel):
     """Response schema for user registration endpoint."""
 
@@ -268,3 +279,72 @@ class HealthCheckResponse(BaseModel):
         ..., description="Database connection status", example="connected"
     )
     uptime: int = Field(..., description="Service uptime in seconds", example=86400)
+
+
+class TodayActivityResponse(BaseModel):
+    """Response schema for the daily check-in/check-out counts endpoint."""
+
+    date: str = Field(
+        ...,
+        description="Date the counts were computed for (YYYY-MM-DD)",
+        example="2025-08-30",
+    )
+    checkins: int = Field(
+        ..., description="Number of bookings checking in on this date", example=3
+    )
+    checkouts: int = Field(
+        ..., description="Number of bookings checking out on this date", example=2
+    )
+
+
+class BookingFormBootstrapResponse(BaseModel):
+    """Combined payload for populating the booking form in a single request."""
+
+    clients: List[Client] = Field(
+        ..., description="Clients available for selection in the booking form"
+    )
+    accommodations: List[Accommodation] = Field(
+        ..., description="All accommodations, regardless of availability"
+    )
+    available: List[AvailableAccommodation] = Field(
+        ...,
+        description=(
+            "Accommodations available for the requested dates; empty when no "
+            "date range is provided"
+        ),
+    )
+
+
+class DashboardSummaryResponse(BaseModel):
+    """Response schema for the aggregated dashboard summary endpoint."""
+
+    total_accommodations: int = Field(
+        ..., description="Total number of accommodations", example=50
+    )
+    total_clients: int = Field(
+        ..., description="Total number of registered clients", example=320
+    )
+    active_bookings: int = Field(
+        ...,
+        description="Number of confirmed or checked-in bookings",
+        example=18,
+    )
+    open_bookings: int = Field(
+        ..., description="Number of open-dates bookings awaiting dates", example=4
+    )
+    occupancy_rate: float = Field(
+        ...,
+        description="Share of accommodations occupied today as a percentage (0-100)",
+        example=64.0,
+    )
+    revenue_today: float = Field(
+        ...,
+        description="Nightly revenue of accommodations occupied today",
+        example=4800.00,
+    )
+    today_checkins: int = Field(
+        ..., description="Number of bookings checking in today", example=3
+    )
+    today_checkouts: int = Field(
+        ..., description="Number of bookings checking out today", example=2
+    )
@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -84,6 +84,8 @@ class AccommodationService:
         self,
         type_id: Optional[int] = None,
         status: Optional[AccommodationStatus] = None,
+        skip: int = 0,
+        limit: Optional[int] = 100,
     ) -> List[Accommodation]:
         stmt = select(Accommodation).options(selectinload(Accommodation.type))
 
@@ -93,9 +95,30 @@ class AccommodationService:
         if status is not None:
             stmt = stmt.where(Accommodation.status == status)
 
+        stmt = stmt.offset(skip)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    async def count(
+        self,
+        type_id: Optional[int] = None,
+        status: Optional[AccommodationStatus] = None,
+    ) -> int:
+        """Count accommodations matching the filters without fetching rows"""
+        stmt = select(func.count(Accommodation.id))
+
+        if type_id is not None:
+            stmt = stmt.where(Accommodation.type_id == type_id)
+
+        if status is not None:
+            stmt = stmt.where(Accommodation.status == status)
+
+        result = await self.db.execute(stmt)
+        return result.scalar() or 0
+
     async def get_by_id(self, accommodation_id: int) -> Optional[Accommodation]:
         stmt = (
             select(Accommodation)
@@ -19,6 +19,7 @@ from app.schemas.batch import (
     BookingStatusUpdateOperation,
     BulkBookingConfirmation,
     BulkDateAssignment,
+    ClientUpdateOperation,
 )
 
 
@@ -216,6 +217,42 @@ class BatchOperationService:
         # Execute batch
         return await self.processor.execute_batch(batch_request, user_id)
 
+    async def bulk_update_clients(
+        self,
+        operation: ClientUpdateOperation,
+        user_id: Optional[int] = None,
+        dry_run: bool = False,
+    ) -> BatchJobResult:
+        """Bulk update client fields in a single batch request."""
+
+        # Create batch operations
+        batch_operations = []
+        for client_update in operation.client_updates:
+            parameters = {
+                field: value
+                for field, value in client_update.items()
+                if field != "client_id"
+            }
+            batch_op = BatchOperationItem(
+                target_id=client_update["client_id"],
+                operation_type=BatchOperationType.CLIENT_UPDATE,
+                parameters=parameters,
+            )
+            batch_operations.append(batch_op)
+
+        # Create batch request
+        batch_request = BatchRequest(
+            job_name=f"Bulk Client Update: {len(operation.client_updates)} clients",
+            description="Update client fields in bulk",
+            operations=batch_operations,
+            dry_run=dry_run,
+            fail_fast=False,
+            enable_compensation=True,
+        )
+
+        # Execute batch
+        return await self.processor.execute_batch(batch_request, user_id)
+
     async def bulk_confirm_bookings(
         self,
         operation: BulkBookingConfirmation,
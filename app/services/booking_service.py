@@ -77,6 +77,39 @@ class BookingService:
         result = await self.db.execute(stmt)
         return result.scalars().all()
 
+    async def get_by_statuses(
+        self, statuses: List[BookingStatus], skip: int = 0, limit: int = 100
+    ) -> List[Booking]:
+        """Get bookings matching any of the given statuses in one query"""
+        stmt = (
+            select(Booking)
+            .options(
+                selectinload(Booking.client),
+                selectinload(Booking.accommodation).selectinload(Accommodation.type),
+            )
+            .where(Booking.status.in_(statuses))
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalars().all()
+
+    async def count_by_statuses(self, statuses: List[BookingStatus]) -> int:
+        """Count bookings matching any of the given statuses"""
+        stmt = select(func.count(Booking.id)).where(Booking.status.in_(statuses))
+        result = await self.db.execute(stmt)
+        return result.scalar() or 0
+
+    async def count(self, status: Optional[BookingStatus] = None) -> int:
+        """Count bookings with an optional status filter without fetching rows"""
+        stmt = select(func.count(Booking.id))
+
+        if status is not None:
+            stmt = stmt.where(Booking.status == status)
+
+        result = await self.db.execute(stmt)
+        return result.scalar() or 0
+
     async def get_open_dates_bookings(
         self, skip: int = 0, limit: int = 100
     ) -> List[Booking]:
@@ -94,6 +127,34 @@ class BookingService:
         result = await self.db.execute(stmt)
         return result.scalars().all()
 
+    async def get_daily_activity_counts(self, target_date: date) -> Dict[str, int]:
+        """Count check-ins and check-outs for a date in a single aggregate query"""
+        stmt = select(
+            func.count(Booking.id)
+            .filter(
+                and_(
+                    Booking.check_in_date == target_date,
+                    Booking.status.in_(
+                        [BookingStatus.CONFIRMED, BookingStatus.CHECKED_IN]
+                    ),
+                )
+            )
+            .label("checkins"),
+            func.count(Booking.id)
+            .filter(
+                and_(
+                    Booking.check_out_date == target_date,
+                    Booking.status.in_(
+                        [BookingStatus.CHECKED_IN, BookingStatus.CHECKED_OUT]
+                    ),
+                )
+            )
+            .label("checkouts"),
+        )
+        result = await self.db.execute(stmt)
+        row = result.first()
+        return {"checkins": row.checkins or 0, "checkouts": row.checkouts or 0}
+
     async def get_bookings_by_date_range(
         self, start_date: date, end_date: date
     ) -> List[Booking]:
@@ -7,7 +7,7 @@ from sqlalchemy.orm import selectinload
 
 from app.models.accommodation import Accommodation
 from app.models.booking import Booking, BookingStatus
-from app.schemas.booking import CalendarEvent, CalendarOccupancy
+from app.schemas.booking import CalendarDaySummary, CalendarEvent, CalendarOccupancy
 
 
 class CalendarService:
@@ -129,6 +129,54 @@ class CalendarService:
 
         return occupancy_data
 
+    async def get_occupancy_summary(
+        self, start_date: date, end_date: date
+    ) -> List[CalendarDaySummary]:
+        """Get aggregated per-day occupancy counts for a date range"""
+        total_stmt = select(func.count(Accommodation.id))
+        total_result = await self.db.execute(total_stmt)
+        total_accommodations = total_result.scalar() or 0
+
+        # Only the booking intervals are needed for the counts
+        bookings_stmt = select(Booking.check_in_date, Booking.check_out_date).where(
+            and_(
+                ~Booking.is_open_dates,  # Only bookings with confirmed dates
+                Booking.status.in_(
+                    [
+                        BookingStatus.CONFIRMED,
+                        BookingStatus.CHECKED_IN,
+                        BookingStatus.CHECKED_OUT,
+                    ]
+                ),
+                Booking.check_in_date <= end_date,
+                Booking.check_out_date >= start_date,
+            )
+        )
+        bookings_result = await self.db.execute(bookings_stmt)
+        intervals = bookings_result.all()
+
+        summary = []
+        current_date = start_date
+        while current_date <= end_date:
+            occupied = sum(
+                1
+                for check_in, check_out in intervals
+                if check_in <= current_date < check_out
+            )
+            summary.append(
+                CalendarDaySummary(
+                    date=current_date,
+                    occupied=occupied,
+                    total=total_accommodations,
+                    occupancy_rate=round(occupied / total_accommodations * 100, 1)
+                    if total_accommodations
+                    else 0.0,
+                )
+            )
+            current_date += timedelta(days=1)
+
+        return summary
+
     async def get_calendar_events(
         self, start_date: date, end_date: date
     ) -> List[CalendarEvent]:
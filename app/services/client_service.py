@@ -75,8 +75,10 @@ class ClientService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Client]:
-        stmt = select(Client).offset(skip).limit(limit)
+    async def get_all(self, skip: int = 0, limit: Optional[int] = 100) -> List[Client]:
+        stmt = select(Client).options(selectinload(Client.group)).offset(skip)
+        if limit is not None:
+            stmt = stmt.limit(limit)
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
@@ -103,6 +105,23 @@ class ClientService:
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    async def count(self, search: Optional[str] = None) -> int:
+        """Count clients matching an optional search without fetching rows"""
+        stmt = select(func.count(Client.id))
+
+        if search:
+            stmt = stmt.where(
+                or_(
+                    func.lower(Client.first_name).contains(search.lower()),
+                    func.lower(Client.last_name).contains(search.lower()),
+                    Client.phone.contains(search),
+                    func.lower(Client.email).contains(search.lower()),
+                )
+            )
+
+        result = await self.db.execute(stmt)
+        return result.scalar() or 0
+
     async def get_by_phone(self, phone: str) -> Optional[Client]:
         stmt = select(Client).where(Client.phone == phone)
         result = await self.db.execute(stmt)
@@ -162,16 +181,51 @@ class ClientService:
 
     async def get_client_stats(self, client_id: int) -> ClientWithStats:
         """Get client with basic statistics"""
-        db_client = await self.get_by_id(client_id)
-        db_client = ensure_exists(db_client, "Client", client_id)
+        clients_with_stats = await self.get_client_stats_batch([client_id])
+        if not clients_with_stats:
+            ensure_exists(None, "Client", client_id)
+
+        return clients_with_stats[0]
+
+    async def get_client_stats_batch(
+        self, client_ids: List[int]
+    ) -> List[ClientWithStats]:
+        """Get stats for multiple clients in a single aggregated query"""
+        from app.models.booking import Booking
+
+        stmt = (
+            select(
+                Client,
+                func.count(Booking.id).label("visits_count"),
+                func.coalesce(func.sum(Booking.total_amount), 0).label("total_spent"),
+            )
+            .options(selectinload(Client.group))
+            .outerjoin(
+                Booking,
+                and_(
+                    Booking.client_id == Client.id,
+                    Booking.status.in_(
+                        [
+                            BookingStatus.CONFIRMED,
+                            BookingStatus.CHECKED_IN,
+                            BookingStatus.CHECKED_OUT,
+                        ]
+                    ),
+                ),
+            )
+            .where(Client.id.in_(client_ids))
+            .group_by(Client.id)
+        )
+        result = await self.db.execute(stmt)
 
-        # For now, return zero stats since we don't have bookings yet
-        # This will be updated in iteration 3 when booking system is implemented
-        client_with_stats = ClientWithStats.model_validate(db_client)
-        client_with_stats.visits_count = 0
-        client_with_stats.total_spent = 0.0
+        clients_with_stats = []
+        for client, visits_count, total_spent in result.all():
+            client_with_stats = ClientWithStats.model_validate(client)
+            client_with_stats.visits_count = visits_count or 0
+            client_with_stats.total_spent = float(total_spent or 0)
+            clients_with_stats.append(client_with_stats)
 
-        return client_with_stats
+        return clients_with_stats
 
     # Enhanced search and filtering methods
     async def advanced_search(
@@ -0,0 +1,104 @@
+from datetime import date
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.accommodation import Accommodation
+from app.models.booking import Booking, BookingStatus
+from app.models.client import Client
+from app.schemas.responses import DashboardSummaryResponse
+
+
+class DashboardService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_summary(self) -> DashboardSummaryResponse:
+        """Get aggregated dashboard metrics in a single round trip.
+
+        All counts are computed server-side with COUNT/SUM queries so the
+        dashboard doesn't need to download full entity lists just to count them.
+        """
+        today = date.today()
+
+        total_accommodations_result = await self.db.execute(
+            select(func.count(Accommodation.id))
+        )
+        total_accommodations = total_accommodations_result.scalar() or 0
+
+        total_clients_result = await self.db.execute(select(func.count(Client.id)))
+        total_clients = total_clients_result.scalar() or 0
+
+        # Booking counts grouped by status in one query
+        status_counts_result = await self.db.execute(
+            select(Booking.status, func.count(Booking.id)).group_by(Booking.status)
+        )
+        status_counts = dict(status_counts_result.all())
+        active_bookings = status_counts.get(
+            BookingStatus.CONFIRMED, 0
+        ) + status_counts.get(BookingStatus.CHECKED_IN, 0)
+
+        open_bookings_result = await self.db.execute(
+            select(func.count(Booking.id)).where(Booking.is_open_dates)
+        )
+        open_bookings = open_bookings_result.scalar() or 0
+
+        # Bookings occupying accommodations today, with their nightly revenue
+        occupied_today_result = await self.db.execute(
+            select(
+                func.count(Booking.id),
+                func.coalesce(func.sum(Accommodation.price_per_night), 0),
+            )
+            .join(Accommodation, Booking.accommodation_id == Accommodation.id)
+            .where(
+                and_(
+                    Booking.status.in_(
+                        [BookingStatus.CONFIRMED, BookingStatus.CHECKED_IN]
+                    ),
+                    Booking.check_in_date <= today,
+                    Booking.check_out_date > today,
+                )
+            )
+        )
+        occupied_today, revenue_today = occupied_today_result.first()
+
+        occupancy_rate = (
+            (occupied_today / total_accommodations * 100)
+            if total_accommodations > 0
+            else 0.0
+        )
+
+        today_checkins_result = await self.db.execute(
+            select(func.count(Booking.id)).where(
+                and_(
+                    Booking.check_in_date == today,
+                    Booking.status.in_(
+                        [BookingStatus.CONFIRMED, BookingStatus.CHECKED_IN]
+                    ),
+                )
+            )
+        )
+        today_checkins = today_checkins_result.scalar() or 0
+
+        today_checkouts_result = await self.db.execute(
+            select(func.count(Booking.id)).where(
+                and_(
+                    Booking.check_out_date == today,
+                    Booking.status.in_(
+                        [BookingStatus.CHECKED_IN, BookingStatus.CHECKED_OUT]
+                    ),
+                )
+            )
+        )
+        today_checkouts = today_checkouts_result.scalar() or 0
+
+        return DashboardSummaryResponse(
+            total_accommodations=total_accommodations,
+            total_clients=total_clients,
+            active_bookings=active_bookings,
+            open_bookings=open_bookings,
+            occupancy_rate=round(occupancy_rate, 2),
+            revenue_today=float(revenue_today),
+            today_checkins=today_checkins,
+            today_checkouts=today_checkouts,
+        )
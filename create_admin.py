@@ -4,83 +4,161 @@ Script to create an admin user (staff role) for the booking system.
 Run this script to create the first administrative user.
 """
 
+import argparse
 import asyncio
+import getpass
 import sys
+import threading
 
-from sqlalchemy import select
 
-from app.core.database import AsyncSessionLocal
-from app.core.security import get_password_hash
-from app.models.user import User, UserRole
+def _warm_bcrypt():
+    """Load the bcrypt extension with a minimal-cost hash so the first
+    real hash doesn't pay library initialization on top of 2^cost work."""
+    try:
+        import bcrypt
+
+        bcrypt.hashpw(b"warm", bcrypt.gensalt(rounds=4))
+    except Exception:
+        pass
+
+
+def _build_engine():
+    """Build a pool-less engine for this one-shot script.
+
+    Deferred so --help and argument errors skip the SQLAlchemy and
+    driver import cost entirely."""
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import NullPool
+
+    from app.core.database import database_url
+
+    # The script issues a single statement, so skip the QueuePool
+    # machinery the application engine carries
+    return create_async_engine(database_url, poolclass=NullPool)
+
 
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Create an admin user (staff role) for the booking system"
+    )
+    parser.add_argument("--username", help="Admin username")
+    parser.add_argument("--email", help="Admin email")
+    parser.add_argument(
+        "--password", help="Admin password (prefer --password-stdin in scripts)"
+    )
+    parser.add_argument(
+        "--password-stdin",
+        action="store_true",
+        help="Read the password from standard input (skips confirmation)",
+    )
+    return parser.parse_args()
 
-async def create_admin_user():
+
+async def create_admin_user(args, engine):
     print("🔧 Creating admin user for Booking System")
     print("-" * 40)
 
-    # Get user input
-    username = input("Enter admin username: ").strip()
+    # Warm bcrypt in the background while the user types
+    threading.Thread(target=_warm_bcrypt, daemon=True).start()
+
+    # Get user input, preferring command-line arguments over prompts
+    username = (args.username or input("Enter admin username: ")).strip()
     if not username:
         print("❌ Username cannot be empty")
         return False
 
-    email = input("Enter admin email: ").strip()
+    email = (args.email or input("Enter admin email: ")).strip()
     if not email:
         print("❌ Email cannot be empty")
         return False
 
-    password = input("Enter admin password: ").strip()
-    if not password:
-        print("❌ Password cannot be empty")
-        return False
+    # Passwords are not stripped: leading/trailing spaces are legitimate
+    if args.password_stdin or args.password:
+        if args.password_stdin:
+            password = sys.stdin.readline().rstrip("\n")
+        else:
+            password = args.password
+        if not password:
+            print("❌ Password cannot be empty")
+            return False
+        if len(password) < 6:
+            print("❌ Password must be at least 6 characters long")
+            return False
+    else:
+        # Validate before asking for confirmation so a bad password is
+        # rejected after one entry, not two; allow a few retries
+        for _ in range(3):
+            password = getpass.getpass("Enter admin password: ")
+            if not password:
+                print("❌ Password cannot be empty")
+                continue
+            if len(password) < 6:
+                print("❌ Password must be at least 6 characters long")
+                continue
+            if sys.stdin.isatty():
+                password_confirm = getpass.getpass("Confirm password: ")
+                if password != password_confirm:
+                    print("❌ Passwords do not match")
+                    continue
+            break
+        else:
+            print("❌ Too many invalid password attempts")
+            return False
 
-    # Confirm password
-    password_confirm = input("Confirm password: ").strip()
-    if password != password_confirm:
-        print("❌ Passwords do not match")
-        return False
+    from app.core.security import get_password_hash
 
-    if len(password) < 6:
-        print("❌ Password must be at least 6 characters long")
-        return False
+    # Hash before opening the transaction so it stays short; bcrypt is
+    # CPU-bound, so keep it off the event loop
+    hashed_password = await asyncio.to_thread(get_password_hash, password)
+
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from app.models.user import User, UserRole
+
+    SessionLocal = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
 
     # Create async database session
-    async with AsyncSessionLocal() as db:
+    async with SessionLocal() as db:
         try:
-            # Check if user already exists
-            existing_user_stmt = select(User).where(
-                (User.username == username) | (User.email == email)
+            # Single round trip: the unique indexes on username/email
+            # arbitrate duplicates instead of a separate SELECT, which
+            # also closes the check-then-insert race
+            insert_stmt = (
+                pg_insert(User)
+                .values(
+                    username=username,
+                    email=email,
+                    hashed_password=hashed_password,
+                    role=UserRole.STAFF,  # Highest permission role
+                    is_active=True,
+                )
+                .on_conflict_do_nothing()
+                .returning(User.id)
             )
-            existing_user_result = await db.execute(existing_user_stmt)
-            existing_user = existing_user_result.scalar_one_or_none()
+            insert_result = await db.execute(insert_stmt)
+            new_user_id = insert_result.scalar_one_or_none()
+            await db.commit()
 
-            if existing_user:
+            if new_user_id is None:
                 print(
                     f"❌ User with username '{username}' or email '{email}' already exists"
                 )
                 return False
 
-            # Create new admin user
-            hashed_password = get_password_hash(password)
-            admin_user = User(
-                username=username,
-                email=email,
-                hashed_password=hashed_password,
-                role=UserRole.STAFF,  # Highest permission role
-                is_active=True,
+            # One buffered write instead of a syscall per line
+            sys.stdout.write(
+                "✅ Admin user created successfully!\n"
+                f"   Username: {username}\n"
+                f"   Email: {email}\n"
+                f"   Role: {UserRole.STAFF.value}\n"
+                f"   User ID: {new_user_id}\n"
+                "\n"
+                "🚀 You can now login to the system with these credentials.\n"
             )
-
-            db.add(admin_user)
-            await db.commit()
-            await db.refresh(admin_user)
-
-            print("✅ Admin user created successfully!")
-            print(f"   Username: {admin_user.username}")
-            print(f"   Email: {admin_user.email}")
-            print(f"   Role: {admin_user.role.value}")
-            print(f"   User ID: {admin_user.id}")
-            print()
-            print("🚀 You can now login to the system with these credentials.")
+            sys.stdout.flush()
 
             return True
 
@@ -91,22 +169,31 @@ async def create_admin_user():
 
 
 async def main():
-    print("=" * 50)
-    print("🏠 BOOKING SYSTEM - ADMIN USER CREATOR")
-    print("=" * 50)
-    print()
+    args = parse_args()
+
+    sys.stdout.write(
+        f"{'=' * 50}\n🏠 BOOKING SYSTEM - ADMIN USER CREATOR\n{'=' * 50}\n\n"
+    )
+    sys.stdout.flush()
+
+    # Fail fast on an unreachable database before asking for credentials
+    try:
+        from sqlalchemy import text
+
+        engine = _build_engine()
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    except Exception as e:
+        print(f"❌ Cannot connect to the database: {str(e)}")
+        sys.exit(1)
 
     try:
-        success = await create_admin_user()
+        success = await create_admin_user(args, engine)
         if success:
-            print("\n" + "=" * 50)
-            print("✅ SETUP COMPLETE!")
-            print("=" * 50)
+            sys.stdout.write(f"\n{'=' * 50}\n✅ SETUP COMPLETE!\n{'=' * 50}\n")
             sys.exit(0)
         else:
-            print("\n" + "=" * 50)
-            print("❌ SETUP FAILED!")
-            print("=" * 50)
+            sys.stdout.write(f"\n{'=' * 50}\n❌ SETUP FAILED!\n{'=' * 50}\n")
             sys.exit(1)
 
     except KeyboardInterrupt: